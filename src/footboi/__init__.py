@@ -1,54 +1,104 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import json
 import logging
 import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
 
 from footboi.adapter import ADAPTER
 from footboi.storage import Storage
-from footboi.common import Transaction, Adapter
+from footboi.common import TRANSACTION_FIELDS, Transaction, Adapter
 from footboi.config import Config
+from footboi.feed import publish_poll_fail, publish_transactions, serve_feed
+from footboi.profiling import profile, span, trace
 from footboi.webhook import notify_transactions
+from footboi.workers import WorkerError, WorkerPool
 
 logger = logging.getLogger()
 
+def _poll_in_process(accounts: list[Adapter]) -> Iterator[tuple[Adapter, list[Transaction] | Exception]]:
+    for account in accounts:
+        result: list[Transaction] | Exception
+
+        with span(f"poll.{account.get_adapter()}.{account.get_name()}"):
+            try:
+                result = account.poll()
+            except Exception as e:
+                result = e
+
+        yield account, result
+
+
 def _get_transactions(
     accounts: list[Adapter],
     storage: Storage,
+    pool: WorkerPool | None = None,
 ) -> list[Transaction]:
     new_transactions: list[Transaction] = []
 
+    active_accounts: list[Adapter] = []
+
     for account in accounts:
         account_adapter = account.get_adapter()
         account_name = account.get_name()
         if not storage.is_account_enabled(account_adapter, account_name):
             logger.info("Skipping inactive account: %s.%s", account_adapter, account_name)
-            return []
+            continue
 
-        transactions: list[Transaction]
+        active_accounts.append(account)
 
-        try:
-            transactions = account.poll()
-        except Exception as e:
+    results = _poll_in_process(active_accounts) if pool is None else pool.poll(active_accounts, storage)
+
+    for account, result in results:
+        account_adapter = account.get_adapter()
+        account_name = account.get_name()
+
+        if isinstance(result, WorkerError):
+            # NOTE (empwilli 2026-10-19): Crashes and timeouts may be transient,
+            # so only skip the account for this cycle.
+            logger.warning("Worker failed while polling %s %s: %s.", account_adapter, account_name, result)
+            publish_poll_fail(storage, account_adapter, account_name)
+            continue
+
+        if isinstance(result, Exception):
             logging.warning(
                 "Failed to poll transactions for %s %s: %s. Deactivating connection.",
-                account.get_adapter(),
-                account.get_name(),
-                e,
+                account_adapter,
+                account_name,
+                result,
             )
             storage.disable_account(account_adapter, account_name)
+            publish_poll_fail(storage, account_adapter, account_name)
             continue
 
-        new_transactions.extend(transactions)
+        new_transactions.extend(result)
 
     return new_transactions
 
 
-def _get_accounts(config: Config) -> list[Adapter]:
-    adapters: list[Adapter] = []
+def _fetch(config: Config, storage: Storage, pool: WorkerPool | None = None) -> None:
+    accounts = _get_accounts(config, storage)
 
-    storage = Storage(config)
+    transactions = _get_transactions(accounts, storage, pool)
+
+    new_transactions = storage.store_new_transactions(transactions)
+
+    publish_transactions(storage, new_transactions)
+    notify_transactions(config.notification, new_transactions)
+
+    storage.archive_expired()
+
+
+def _get_accounts(config: Config, storage: Storage) -> list[Adapter]:
+    adapters: list[Adapter] = []
 
     for adapter in ADAPTER.values():
         adapters.extend(adapter.get_adapters(config, storage))
@@ -66,8 +116,9 @@ def init(args: argparse.Namespace) -> None:
     config = Config.from_toml_file(config_path)
 
     storage = Storage(config)
+    storage.ensure_schema()
 
-    accounts = _get_accounts(config)
+    accounts = _get_accounts(config, storage)
 
     for account in accounts:
         account_adapter = account.get_adapter()
@@ -89,20 +140,109 @@ def fetch(args: argparse.Namespace) -> None:
     config = Config.from_toml_file(config_path)
 
     storage = Storage(config)
+    storage.ensure_schema()
 
-    accounts = _get_accounts(config)
+    # NOTE (empwilli 2026-10-19): Poll in process when profiling, otherwise the
+    # profile only shows the coordinator waiting for the workers.
+    use_workers = config.workers.processes > 0 and not args.profile
 
-    new_transactions = _get_transactions(accounts, storage)
+    if config.workers.processes > 0 and args.profile:
+        logger.info("Polling in the main process for profiling, ignoring workers.processes.")
 
-    for transaction in new_transactions:
-        if storage.exists_transaction(transaction):
-            continue
+    with WorkerPool(config) if use_workers else nullcontext() as pool:
+        with profile(args.profile, args.profiler) if args.profile else nullcontext():
+            _fetch(config, storage, pool)
 
-        new_transactions.append(transaction)
 
-        storage.store_transaction(transaction)
+def serve(args: argparse.Namespace) -> None:
+    """Periodically fetch transaction data and serve the event feed."""
+    config_path = Path()
 
-    notify_transactions(config.notification, new_transactions)
+    if args.config:
+        config_path = args.config
+
+    config = Config.from_toml_file(config_path)
+
+    storage = Storage(config)
+    storage.ensure_schema()
+
+    server = serve_feed(config.feed, storage)
+
+    pool = WorkerPool(config) if config.workers.processes else None
+
+    slow_cycle = config.profiling.slow_cycle
+    trace_dir = config.profiling.trace_dir.expanduser()
+
+    try:
+        while True:
+            try:
+                if slow_cycle is None:
+                    _fetch(config, storage, pool)
+                else:
+                    with trace() as cycle_trace:
+                        _fetch(config, storage, pool)
+
+                    if cycle_trace.duration > slow_cycle.total_seconds():
+                        trace_dir.mkdir(parents=True, exist_ok=True)
+                        trace_path = trace_dir / f"cycle-{datetime.now():%Y%m%dT%H%M%S}.json"
+                        cycle_trace.dump(trace_path)
+                        logger.warning(
+                            "Slow fetch cycle took %.1fs, wrote trace to %s", cycle_trace.duration, trace_path
+                        )
+            except Exception as e:
+                # NOTE (empwilli 2026-10-19): Keep serving the feed, e.g. if a
+                # webhook endpoint or the storage is temporarily unreachable.
+                logger.exception("Fetch cycle failed: %s", e)
+
+            time.sleep(config.interval.total_seconds())
+    finally:
+        server.shutdown()
+
+        if pool is not None:
+            pool.shutdown()
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date, converted to naive UTC like the stored dates."""
+    parsed = datetime.fromisoformat(value)
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return parsed
+
+
+def query(args: argparse.Namespace) -> None:
+    """Stream stored transactions matching the given filters to stdout."""
+    config_path = Path()
+
+    if args.config:
+        config_path = args.config
+
+    config = Config.from_toml_file(config_path)
+
+    storage = Storage(config)
+
+    transactions = storage.query_transactions(
+        adapter=args.adapter,
+        name=args.name,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        amount_min=args.amount_min,
+        amount_max=args.amount_max,
+        iban=args.iban,
+        include_archive=args.archive,
+    )
+
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=TRANSACTION_FIELDS)
+        writer.writeheader()
+        writer.writerows(transactions)
+        return
+
+    for transaction in transactions:
+        sys.stdout.write(json.dumps(transaction, default=str))
+        sys.stdout.write("\n")
 
 
 def cli() -> None:
@@ -129,8 +269,46 @@ def cli() -> None:
     init_parser.set_defaults(func=init)
 
     fetch_parser = subparser.add_parser("fetch", help=("Fetch transactions."))
+    fetch_parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PREFIX",
+        help="Profile the fetch cycle and write the results to PREFIX.txt or PREFIX.folded, see --profiler.",
+    )
+    fetch_parser.add_argument(
+        "--profiler",
+        choices=["cprofile", "sampling"],
+        default="cprofile",
+        help=(
+            "cprofile writes a report sorted by cumulative time to PREFIX.txt, sampling writes stacks sampled "
+            "about every 5ms in collapsed format to PREFIX.folded."
+        ),
+    )
     fetch_parser.set_defaults(func=fetch)
 
+    serve_parser = subparser.add_parser(
+        "serve", help="Fetch transactions in the configured interval and serve the event feed."
+    )
+    serve_parser.set_defaults(func=serve)
+
+    query_parser = subparser.add_parser("query", help="Query stored transactions.")
+    query_parser.add_argument("--adapter", help="Only transactions fetched by this adapter, e.g. fints.")
+    query_parser.add_argument("--name", help="Only transactions of this account name in the config.")
+    query_parser.add_argument(
+        "--from", dest="date_from", type=_parse_datetime, help="Earliest booking date (ISO 8601), inclusive."
+    )
+    query_parser.add_argument(
+        "--to", dest="date_to", type=_parse_datetime, help="Latest booking date (ISO 8601), inclusive."
+    )
+    query_parser.add_argument("--min-amount", dest="amount_min", type=Decimal, help="Lowest amount, inclusive.")
+    query_parser.add_argument("--max-amount", dest="amount_max", type=Decimal, help="Highest amount, inclusive.")
+    query_parser.add_argument("--iban", help="Only transactions with this applicant IBAN.")
+    query_parser.add_argument(
+        "--archive", action="store_true", help="Include transactions moved to the archive after the retention period."
+    )
+    query_parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Output format.")
+    query_parser.set_defaults(func=query)
+
     args = parser.parse_args()
 
     args.func(args)
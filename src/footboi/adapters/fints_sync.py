@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import subprocess
-from datetime import date, datetime, timedelta
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
 import logging
 from typing import TYPE_CHECKING, Any, Optional, Self, cast
 
@@ -91,79 +92,137 @@ class Fints(BaseModel):
         return self
 
 
-def to_transaction(name: str, mt940: Mt940Transaction) -> Transaction:
-    """Transform an Mt940 transaction to the internal representation.
+def to_transactions(name: str, mt940_transactions: Iterable[Mt940Transaction]) -> list[Transaction]:
+    """Transform a whole Mt940 statement to the internal representation.
+
+    Fields missing from a record are set to None.
 
     Args:
-        transaction: Mt940Transaction
+        name: account name in the config.
+        mt940_transactions: Iterable[Mt940Transaction]
     """
+    transactions: list[Transaction] = []
+
+    for mt940 in mt940_transactions:
+        # NOTE (empwilli 2024-09-30): mt940 doesn't provide type stubs, silence the
+        # errors.
+        transaction_data = cast(Any, mt940).data
+        booking_date = transaction_data["date"]
+
+        transactions.append(
+            Transaction(
+                "fints",
+                name,
+                datetime.combine(booking_date, time()),
+                str(transaction_data["amount"]),
+                transaction_data.get("applicant_bin"),
+                transaction_data.get("applicant_iban"),
+                transaction_data.get("applicant_name"),
+                transaction_data.get("purpose"),
+                transaction_data.get("recipient_name"),
+            )
+        )
+
+    return transactions
+
 
-    # NOTE (empwilli 2024-09-30): mt940 doesn't provide type stubs, silence the
-    # errors.
-    mt940_transaction = cast(Any, mt940)
-
-    transaction_data = mt940_transaction.data
-
-    return Transaction(
-        "fints",
-        name,
-        datetime(
-            transaction_data["date"].year,
-            transaction_data["date"].month,
-            transaction_data["date"].day,
-        ),
-        str(transaction_data["amount"]),
-        transaction_data["applicant_bin"],
-        transaction_data["applicant_iban"],
-        transaction_data["applicant_name"],
-        transaction_data["purpose"],
-        transaction_data["recipient_name"],
+def _create_client(bank: Bank, account: Account, product_id: str, state: bytes | None) -> FinTS3PinTanClient:
+    return FinTS3PinTanClient(
+        bank.bic,
+        account.login,
+        account.get_password(),
+        bank.endpoint,
+        product_id=product_id,
+        from_data=state,
     )
 
 
+def _poll_client(name: str, client: FinTS3PinTanClient, account_filter: list[str]) -> tuple[list[Transaction], bytes]:
+    """Fetch the transactions of all SEPA accounts not filtered out.
+
+    Returns:
+        tuple[list[Transaction], bytes]: the transactions and the new client state.
+    """
+    transactions: list[Transaction] = []
+
+    end_date = date.today()
+    start_date = end_date - timedelta(days=MONITOR_PERIOD_IN_DAYS)
+
+    try:
+        accounts: list[SEPAAccount] = client.get_sepa_accounts()
+
+        for account in accounts:
+            accountnumber = cast(str, account.accountnumber)  # type: ignore
+
+            if accountnumber in account_filter:
+                continue
+
+            mt940_transactions = cast(list[Mt940Transaction], client.get_transactions(account, start_date, end_date))
+
+            transactions.extend(to_transactions(name, mt940_transactions))
+
+        state = client.deconstruct(including_private=True)
+    except Exception as e:
+        raise ValueError(f"Failed to fetch transaction data: {e}.")
+
+    return transactions, state
+
+
 class FintsAdapter:
     """Poll from banks supporting FINTS."""
 
-    def __init__(
-        self, name: str, storage: Storage, client: FinTS3PinTanClient, account_filter: list[str], two_factor_init: bool
-    ) -> None:
+    def __init__(self, name: str, storage: Storage, bank: Bank, account: Account, product_id: str) -> None:
         self.name = name
         self.storage = storage
-        self.client = client
-        self.account_filter = account_filter
-        self.two_factor_init = two_factor_init
+        self.bank = bank
+        self.account = account
+        self.product_id = product_id
+        self.account_filter = account.account_filter
+        self.two_factor_init = bank.two_factor_auth
+        self._client: FinTS3PinTanClient | None = None
+
+    @property
+    def client(self) -> FinTS3PinTanClient:
+        # NOTE (empwilli 2026-10-19): Create the client on first use only, this
+        # runs the password command and loads the dialog state.
+        if self._client is None:
+            self._client = _create_client(
+                self.bank,
+                self.account,
+                self.product_id,
+                self.storage.account_data("fints", self.name),
+            )
+
+        return self._client
 
     @staticmethod
     def get_adapters(config: Config, storage: Storage) -> list[Adapter]:
         fints_config = cast(Fints, config.fints)
 
-        adapters: list[Adapter] = []
+        return [FintsAdapter.get_account(config, storage, name) for name in fints_config.accounts]
 
-        for name, account in fints_config.accounts.items():
-            bank = fints_config.banks[account.bank]
+    @staticmethod
+    def get_account(config: Config, storage: Storage, name: str) -> Adapter:
+        fints_config = cast(Fints, config.fints)
 
-            state = storage.account_data("fints", name)
+        account = fints_config.accounts[name]
 
-            client = FinTS3PinTanClient(
-                bank.bic,
-                account.login,
-                account.get_password(),
-                bank.endpoint,
-                product_id=fints_config.product_id,
-                from_data=state,
-            )
+        return FintsAdapter(
+            name,
+            storage,
+            fints_config.banks[account.bank],
+            account,
+            fints_config.product_id,
+        )
 
-            adapters.append(
-                FintsAdapter(
-                    name,
-                    storage,
-                    client,
-                    account.account_filter,
-                    bank.two_factor_auth,
-                )
-            )
+    @staticmethod
+    def poll_account(config: Config, name: str, state: bytes | None) -> tuple[list[Transaction], bytes | None]:
+        fints_config = cast(Fints, config.fints)
 
-        return adapters
+        account = fints_config.accounts[name]
+        client = _create_client(fints_config.banks[account.bank], account, fints_config.product_id, state)
+
+        return _poll_client(name, client, account.account_filter)
 
     def setup(self) -> None:
         # NOTE (empwilli 2024-11-12): this operation consumes the client, the
@@ -186,32 +245,11 @@ class FintsAdapter:
         self.storage.enable_account("fints", self.name)
 
     def poll(self) -> list[Transaction]:
-        transactions: list[Transaction] = []
-
-        end_date = date.today()
-        start_date = end_date - timedelta(days=MONITOR_PERIOD_IN_DAYS)
-
         try:
-            accounts: list[SEPAAccount] = self.client.get_sepa_accounts()
-
-            for account in accounts:
-                accountnumber = cast(str, account.accountnumber)  # type: ignore
-
-                if accountnumber in self.account_filter:
-                    continue
-
-                mt940_transactions = cast(
-                    list[Mt940Transaction], self.client.get_transactions(account, start_date, end_date)
-                )
-
-                transactions.extend(
-                    to_transaction(self.name, mt490_transaction) for mt490_transaction in mt940_transactions
-                )
-
-            state = self.client.deconstruct(including_private=True)
-        except Exception as e:
+            transactions, state = _poll_client(self.name, self.client, self.account_filter)
+        except ValueError:
             self.storage.disable_account("fints", self.name)
-            raise ValueError(f"Failed to fetch transaction data: {e}.")
+            raise
 
         self.storage.update_account_data("fints", self.name, state)
 
@@ -0,0 +1,162 @@
+"""Local archive for transactions past the retention period.
+
+Transactions are stored as gzip compressed JSON lines, partitioned by the month
+of their booking date. A small index keeps track of the date range and number
+of transactions per partition, so that scans only need to open the partitions
+overlapping the requested range.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from footboi.common import TRANSACTION_FIELDS, parse_amount
+
+_INDEX_FILE = "index.json"
+
+
+class Archive:
+    """Date-partitioned archive of transactions."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        index_path = self.path / _INDEX_FILE
+
+        if not index_path.exists():
+            return {}
+
+        with index_path.open("r", encoding="utf-8") as index_file:
+            return json.load(index_file)
+
+    def _write_index(self, index: dict[str, dict[str, Any]]) -> None:
+        index_path = self.path / _INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+
+        with tmp_path.open("w", encoding="utf-8") as index_file:
+            json.dump(index, index_file, indent=2, sort_keys=True)
+
+        tmp_path.replace(index_path)
+
+    def write(self, documents: Iterable[dict[str, Any]]) -> None:
+        """Append transactions to their partitions.
+
+        Args:
+            documents (Iterable[dict[str, Any]]): stored transactions, including
+                their "inserted" timestamp.
+        """
+        partitions: dict[str, list[dict[str, Any]]] = {}
+
+        for document in documents:
+            partitions.setdefault(document["date"].strftime("%Y-%m"), []).append(document)
+
+        if not partitions:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        index = self._read_index()
+
+        for partition, partition_documents in partitions.items():
+            file_name = f"{partition}.jsonl.gz"
+
+            dates = [document["date"].isoformat() for document in partition_documents]
+            entry = index.get(file_name, {"first": dates[0], "last": dates[0], "count": 0})
+
+            index[file_name] = {
+                "first": min(entry["first"], *dates),
+                "last": max(entry["last"], *dates),
+                "count": entry["count"] + len(partition_documents),
+            }
+
+        # NOTE (empwilli 2026-10-19): Update the index before the partitions.
+        # A crash in between then at worst overstates the counts, whereas a
+        # partition missing from the index would never be scanned.
+        self._write_index(index)
+
+        for partition, partition_documents in partitions.items():
+            lines = [
+                json.dumps(
+                    {field: document[field] for field in TRANSACTION_FIELDS + ["inserted"]},
+                    default=datetime.isoformat,
+                )
+                + "\n"
+                for document in partition_documents
+            ]
+
+            # NOTE (empwilli 2026-10-19): Concatenated gzip members form a valid
+            # gzip file, so we can append without rewriting the partition.
+            with gzip.open(self.path / f"{partition}.jsonl.gz", "at", encoding="utf-8") as partition_file:
+                partition_file.writelines(lines)
+
+    def scan(
+        self,
+        adapter: str | None = None,
+        name: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        amount_min: Decimal | None = None,
+        amount_max: Decimal | None = None,
+        iban: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream archived transactions matching all given filters.
+
+        Only partitions overlapping the date range are read.
+
+        Args:
+            adapter (str | None): adapter used for access to an endpoint as described in the config.
+            name (str | None): account name in the config.
+            date_from (datetime | None): earliest booking date, inclusive.
+            date_to (datetime | None): latest booking date, inclusive.
+            amount_min (Decimal | None): lowest amount, inclusive.
+            amount_max (Decimal | None): highest amount, inclusive.
+            iban (str | None): IBAN of the applicant.
+
+        Returns:
+            Iterator[dict[str, Any]]: transaction fields of each match, ordered by partition.
+        """
+        for file_name, entry in sorted(self._read_index().items()):
+            if date_from is not None and datetime.fromisoformat(entry["last"]) < date_from:
+                continue
+            if date_to is not None and datetime.fromisoformat(entry["first"]) > date_to:
+                continue
+
+            partition_path = self.path / file_name
+
+            if not partition_path.exists():
+                continue
+
+            with gzip.open(partition_path, "rt", encoding="utf-8") as partition_file:
+                for line in partition_file:
+                    document = json.loads(line)
+                    document["date"] = datetime.fromisoformat(document["date"])
+
+                    if adapter is not None and document["adapter"] != adapter:
+                        continue
+                    if name is not None and document["name"] != name:
+                        continue
+                    if iban is not None and document["applicant_iban"] != iban:
+                        continue
+                    if date_from is not None and document["date"] < date_from:
+                        continue
+                    if date_to is not None and document["date"] > date_to:
+                        continue
+
+                    if amount_min is not None or amount_max is not None:
+                        amount = parse_amount(document["amount"])
+
+                        if amount is None:
+                            continue
+                        if amount_min is not None and amount < amount_min:
+                            continue
+                        if amount_max is not None and amount > amount_max:
+                            continue
+
+                    yield {field: document[field] for field in TRANSACTION_FIELDS}
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -15,6 +16,11 @@ if TYPE_CHECKING:
 
 MONITOR_PERIOD_IN_DAYS = 31
 
+# NOTE (empwilli 2026-10-19): The poll window includes its first day, so a
+# transaction must outlive it by at least a day to not be reported as new again.
+# Add another day of margin for cycles that run late.
+MIN_RETENTION_IN_DAYS = MONITOR_PERIOD_IN_DAYS + 2
+
 
 @dataclass
 class Transaction:
@@ -22,11 +28,22 @@ class Transaction:
     name: str
     date: datetime
     amount: str
-    applicant_bin: str
-    applicant_iban: str
-    applicant_name: str
-    purpose: str
-    recipient_name: str
+    applicant_bin: str | None
+    applicant_iban: str | None
+    applicant_name: str | None
+    purpose: str | None
+    recipient_name: str | None
+
+
+TRANSACTION_FIELDS = [field.name for field in fields(Transaction)]
+
+
+def parse_amount(amount: str) -> Decimal | None:
+    """Extract the numeric part of an amount such as "-12.34 EUR"."""
+    try:
+        return Decimal(amount.split()[0])
+    except (IndexError, InvalidOperation):
+        return None
 
 
 class Adapter(Protocol):
@@ -35,6 +52,15 @@ class Adapter(Protocol):
     @staticmethod
     def get_adapters(config: "Config", storage: "Storage") -> list[Adapter]: ...
 
+    @staticmethod
+    def poll_account(config: "Config", name: str, state: bytes | None) -> tuple[list[Transaction], bytes | None]:
+        """Poll an account without access to the storage.
+
+        Starts from the stored state of the account and returns the new state
+        to store along with the transactions.
+        """
+        ...
+
     def setup(self) -> None: ...
 
     def poll(self) -> list[Transaction]: ...
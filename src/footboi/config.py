@@ -8,10 +8,11 @@ from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Self, Union
 
-from pydantic import BaseModel, HttpUrl, MongoDsn, create_model, field_validator
+from pydantic import BaseModel, Field, HttpUrl, MongoDsn, create_model, field_validator
 from pydantic_settings import BaseSettings
 
 from footboi.adapter import ADAPTER_CONFIG
+from footboi.common import MIN_RETENTION_IN_DAYS
 
 
 class Notification(BaseModel):
@@ -20,14 +21,15 @@ class Notification(BaseModel):
 
 class Storage(BaseModel):
     mongo: MongoDsn
+    # NOTE (empwilli 2026-10-19): Transactions are deduplicated against the
+    # storage, so they must be kept longer than we poll them.
+    retention_days: int = Field(default=MIN_RETENTION_IN_DAYS, ge=MIN_RETENTION_IN_DAYS)
+    archive: Optional[Path] = None
 
 
-config_attributes = {
-    "interval": (timedelta, None),
-    "storage": (Storage, None),
-    "notification": (Notification, None),
-    **{name: (Union[config, None], None) for name, config in ADAPTER_CONFIG.items()},
-}
+class Feed(BaseModel):
+    host: str = "127.0.0.1"
+    port: int = 8090
 
 
 def parse_timedelta(cls: "Config", value: str) -> timedelta:  # type: ignore
@@ -45,6 +47,33 @@ def parse_timedelta(cls: "Config", value: str) -> timedelta:  # type: ignore
     return timedelta(**kwargs)
 
 
+class Profiling(BaseModel):
+    slow_cycle: Optional[timedelta] = None
+    trace_dir: Path = Path("~/.cache/footboi/traces")
+
+    slow_cycle_validator = field_validator("slow_cycle", mode="before")(parse_timedelta)  # type: ignore
+
+
+class Workers(BaseModel):
+    # NOTE (empwilli 2026-10-19): 0 polls all accounts in the main process.
+    processes: int = Field(default=0, ge=0)
+    max_polls_per_worker: Optional[int] = Field(default=None, ge=1)
+    poll_timeout: Optional[timedelta] = timedelta(minutes=5)
+
+    poll_timeout_validator = field_validator("poll_timeout", mode="before")(parse_timedelta)  # type: ignore
+
+
+config_attributes = {
+    "interval": (timedelta, None),
+    "storage": (Storage, None),
+    "notification": (Notification, None),
+    "feed": (Feed, Feed()),
+    "workers": (Workers, Workers()),
+    "profiling": (Profiling, Profiling()),
+    **{name: (Union[config, None], None) for name, config in ADAPTER_CONFIG.items()},
+}
+
+
 validators = {  # type: ignore
     "interval_validator": field_validator("interval", mode="before")(parse_timedelta)  # type: ignore
 }
@@ -54,6 +83,9 @@ if TYPE_CHECKING:
         interval: timedelta
         storage: Storage
         notification: Notification
+        feed: Feed
+        workers: Workers
+        profiling: Profiling
 
         @classmethod
         def from_toml_file(cls, config_path: Path) -> Self: ...
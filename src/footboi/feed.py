@@ -0,0 +1,127 @@
+"""Pull-based event feed as an alternative to webhooks.
+
+Events are appended to the storage and served via long-polling:
+
+    GET /events?after=<seq>&limit=<n>&wait=<seconds>
+
+returns ``{"events": [...], "next": <seq>, "truncated": <bool>}``. Consumers
+pass ``next`` as ``after`` on their next request to resume where they left off.
+``truncated`` is set if events following ``after`` already expired.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+
+from footboi.common import Transaction
+from footboi.webhook import HookType
+
+if TYPE_CHECKING:
+    from footboi.config import Feed
+    from footboi.storage import Storage
+
+logger = logging.Logger(__name__)
+
+_DEFAULT_LIMIT = 1000
+_MAX_LIMIT = 10000
+_MAX_WAIT_IN_SECONDS = 60
+_POLL_INTERVAL_IN_SECONDS = 1
+
+
+def publish_transactions(storage: Storage, transactions: list[Transaction]) -> None:
+    storage.append_events(
+        str(HookType.NewTransactions),
+        [transaction.__dict__ for transaction in transactions],
+    )
+
+
+def publish_poll_fail(storage: Storage, bank: str, account: str) -> None:
+    storage.append_events(
+        str(HookType.FetchFail),
+        [
+            {
+                "bank": bank,
+                "account": account,
+            }
+        ],
+    )
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    storage: Storage
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+
+        if url.path != "/events":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        params = parse_qs(url.query)
+
+        try:
+            after = int(params.get("after", ["0"])[0])
+            limit = max(1, min(int(params.get("limit", [str(_DEFAULT_LIMIT)])[0]), _MAX_LIMIT))
+            wait = min(float(params.get("wait", ["0"])[0]), _MAX_WAIT_IN_SECONDS)
+        except ValueError as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        deadline = time.monotonic() + wait
+
+        events = self.storage.events_after(after, limit)
+        while not events and time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL_IN_SECONDS)
+            events = self.storage.events_after(after, limit)
+
+        # NOTE (empwilli 2026-10-19): Events expire with the retention period,
+        # tell consumers that fell behind further that they missed events.
+        first_seq = self.storage.first_event_seq()
+
+        body = json.dumps(
+            {
+                "events": events,
+                "next": events[-1]["seq"] if events else after,
+                "truncated": first_seq is not None and after < first_seq - 1,
+            },
+            default=str,
+        ).encode("utf-8")
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug(format, *args)
+
+
+def serve_feed(config: Feed, storage: Storage) -> ThreadingHTTPServer:
+    """Serve the event feed in a background thread.
+
+    Args:
+        config (Feed): address to listen on.
+        storage (Storage): storage to read the events from.
+
+    Returns:
+        ThreadingHTTPServer: the running server, call `shutdown` to stop it.
+    """
+    handler = type("FeedHandler", (_FeedHandler,), {"storage": storage})
+
+    server = ThreadingHTTPServer((config.host, config.port), handler)
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    logger.info("Serving event feed on %s:%s", config.host, config.port)
+
+    return server
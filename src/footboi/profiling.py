@@ -0,0 +1,200 @@
+"""Profiling and tracing of fetch cycles.
+
+`profile` wraps a block either in cProfile and writes a sorted report, or in a
+sampling profiler and writes a collapsed-stack file that can be fed to
+flamegraph tools.
+
+`trace` records the spans entered via `span` and `traced` while it is active.
+Outside of a trace, spans only cost a context variable lookup.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+# NOTE (empwilli 2026-10-19): The sampler competes with the profiled thread for
+# the GIL, so the effective rate is lower, the number of samples taken is printed.
+_SAMPLE_INTERVAL_IN_SECONDS = 0.005
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float
+    depth: int
+
+
+@dataclass
+class Trace:
+    start: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    depth: int = 0
+    spans: list[Span] = field(default_factory=list)
+
+    def dump(self, path: Path) -> None:
+        """Write the trace as JSON, span start times relative to the trace start."""
+        with path.open("w", encoding="utf-8") as trace_file:
+            json.dump(
+                {
+                    "duration": self.duration,
+                    "spans": [
+                        {**asdict(span), "start": span.start - self.start}
+                        for span in sorted(self.spans, key=lambda span: span.start)
+                    ],
+                },
+                trace_file,
+                indent=2,
+            )
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+
+
+@contextmanager
+def trace() -> Iterator[Trace]:
+    """Record all spans within the block."""
+    current = Trace()
+    token = _current_trace.set(current)
+
+    try:
+        yield current
+    finally:
+        current.duration = time.perf_counter() - current.start
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record the duration of the block in the current trace, if any."""
+    current = _current_trace.get()
+
+    if current is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    current.depth += 1
+
+    try:
+        yield
+    finally:
+        current.depth -= 1
+        current.spans.append(Span(name, start, time.perf_counter() - start, current.depth))
+
+
+def record_span(name: str, start: float) -> None:
+    """Record a span from `start` until now in the current trace, if any.
+
+    For work that is not confined to a block, e.g. polls running in another
+    process.
+    """
+    current = _current_trace.get()
+
+    if current is not None:
+        current.spans.append(Span(name, start, time.perf_counter() - start, current.depth))
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function to record its calls as spans."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _Sampler(threading.Thread):
+    """Periodically sample the stack of another thread."""
+
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.stacks: Counter[str] = Counter()
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(_SAMPLE_INTERVAL_IN_SECONDS):
+            frame = sys._current_frames().get(self.thread_id)
+
+            stack: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+@contextmanager
+def profile(path: Path, mode: str = "cprofile") -> Iterator[None]:
+    """Profile the block.
+
+    In "cprofile" mode, writes a report sorted by cumulative time to
+    `<path>.txt`. In "sampling" mode, writes the sampled stacks in collapsed
+    format to `<path>.folded`. The modes are exclusive so that neither profiler
+    measures the overhead of the other.
+
+    Args:
+        path (Path): prefix of the output files.
+        mode (str): either "cprofile" or "sampling".
+    """
+    if mode == "sampling":
+        sampler = _Sampler(threading.get_ident())
+        start = time.perf_counter()
+        sampler.start()
+
+        try:
+            yield
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+            duration = time.perf_counter() - start
+
+            with path.with_name(path.name + ".folded").open("w", encoding="utf-8") as folded_file:
+                for stack, count in sampler.stacks.most_common():
+                    folded_file.write(f"{stack} {count}\n")
+
+            samples = sum(sampler.stacks.values())
+            rate = samples / duration if duration else 0
+            print(
+                f"Wrote {samples} samples taken in {duration:.1f}s ({rate:.1f} per second) to {path}.folded",
+                file=sys.stderr,
+            )
+
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+        with path.with_name(path.name + ".txt").open("w", encoding="utf-8") as report_file:
+            pstats.Stats(profiler, stream=report_file).sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+
+        print(f"Wrote profile to {path}.txt", file=sys.stderr)
@@ -4,16 +4,64 @@ from __future__ import annotations
 
 import datetime
 import logging
+import time
+from collections.abc import Iterator
+from decimal import Decimal
 from typing import Any
 
-from pymongo import MongoClient
+from bson.decimal128 import Decimal128
+from pymongo import ASCENDING, MongoClient, ReturnDocument
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
-from footboi.common import Transaction, MONITOR_PERIOD_IN_DAYS
+from footboi.archive import Archive
+from footboi.common import TRANSACTION_FIELDS, Transaction, parse_amount
 from footboi.config import Config
+from footboi.profiling import traced
 
 logger = logging.Logger(__name__)
 
-_EXPIRY_PERIOD = MONITOR_PERIOD_IN_DAYS * 24 * 60 * 60
+# NOTE (empwilli 2026-10-19): The compound indexes keep the equality fields
+# first and the range field last, which serves per-account and per-IBAN
+# queries. The single field indexes serve plain date or amount ranges across
+# all accounts. Other combinations, e.g. an IBAN with an amount range, still
+# filter part of the results after the index scan.
+_TRANSACTION_INDEXES = [
+    [("adapter", ASCENDING), ("name", ASCENDING), ("date", ASCENDING)],
+    [("adapter", ASCENDING), ("name", ASCENDING), ("amount_value", ASCENDING)],
+    [("applicant_iban", ASCENDING), ("date", ASCENDING)],
+    [("date", ASCENDING)],
+    [("amount_value", ASCENDING)],
+]
+
+_QUERY_BATCH_SIZE = 1000
+_EVENTS_LOCK_LEASE = datetime.timedelta(minutes=1)
+_EVENTS_LOCK_RETRY_IN_SECONDS = 0.1
+_ARCHIVE_BATCH_SIZE = 10000
+
+
+def _amount_value(amount: str) -> Decimal128 | None:
+    value = parse_amount(amount)
+
+    if value is None:
+        return None
+
+    return Decimal128(value)
+
+
+def _ensure_expiry_index(collection: Collection[dict[str, Any]], field: str, expire_after: int | None) -> None:
+    """Create an index on field, dropping documents after expire_after seconds, if set.
+
+    An existing index on field with a different expiry is replaced.
+    """
+    index = collection.index_information().get(f"{field}_1")
+    if index is not None and index.get("expireAfterSeconds") != expire_after:
+        collection.drop_index(f"{field}_1")
+
+    if expire_after is None:
+        collection.create_index(field)
+    else:
+        collection.create_index(field, expireAfterSeconds=expire_after)
 
 
 class Storage:
@@ -21,44 +69,324 @@ class Storage:
 
     def __init__(self, config: Config) -> None:
         self.client: MongoClient[dict[str, Any]] = MongoClient(str(config.storage.mongo))
+        self.retention = datetime.timedelta(days=config.storage.retention_days)
+        self.archive = Archive(config.storage.archive.expanduser()) if config.storage.archive else None
+
+    def ensure_schema(self) -> None:
+        """Create the indexes and migrate stored data to the current schema.
 
-    def exists_transaction(self, transaction: Transaction) -> bool:
-        """Check whether the storage already contains transaction.
+        Call this from commands that write to the storage, not on every
+        construction.
+        """
+        collection = self.client["footboi"]["transactions"]
+
+        # NOTE (empwilli 2026-10-19): With an archive, expired transactions are
+        # moved by `archive_expired`, so Mongo must not delete them behind our
+        # back. Without one, let the TTL index drop them.
+        expire_after = None if self.archive else int(self.retention.total_seconds())
+
+        _ensure_expiry_index(collection, "inserted", expire_after)
+
+        for keys in _TRANSACTION_INDEXES:
+            collection.create_index(keys)
+
+        self._migrate_amount_value()
+
+        events = self.client["footboi"]["events"]
+        _ensure_expiry_index(events, "timestamp", int(self.retention.total_seconds()))
+        events.create_index("seq", unique=True)
+
+    def _migrate_amount_value(self) -> None:
+        """Derive "amount_value" from "amount" such as "-12.34 EUR" for transactions stored before it existed."""
+        migrations = self.client["footboi"]["migrations"]
+
+        if migrations.find_one({"_id": "amount_value"}) is not None:
+            return
+
+        self.client["footboi"]["transactions"].update_many(
+            {"amount_value": {"$exists": False}},
+            [
+                {
+                    "$set": {
+                        "amount_value": {
+                            "$convert": {
+                                "input": {"$arrayElemAt": [{"$split": ["$amount", " "]}, 0]},
+                                "to": "decimal",
+                                "onError": None,
+                                "onNull": None,
+                            }
+                        }
+                    }
+                }
+            ],
+        )
+
+        migrations.update_one({"_id": "amount_value"}, {"$set": {"done": True}}, upsert=True)
+
+    @traced("storage.store_new_transactions")
+    def store_new_transactions(self, transactions: list[Transaction]) -> list[Transaction]:
+        """Store all transactions the storage does not contain yet.
+
+        Looks up the stored transactions of each account in the date range of
+        the batch with a single query and inserts the new ones at once.
 
         Args:
-            transaction (Transaction): transaction info to look for.
+            transactions (list[Transaction]): transaction info to store.
 
         Returns:
-            bool: True, if transaction already exists in the storage, False
-            otherwise.
-
+            list[Transaction]: the transactions that were new.
         """
         collection = self.client["footboi"]["transactions"]
-        collection.create_index("inserted", expireAfterSeconds=_EXPIRY_PERIOD)
 
-        if collection.find_one(transaction.__dict__):
-            return True
+        accounts: dict[tuple[str, str], list[Transaction]] = {}
+        for transaction in transactions:
+            accounts.setdefault((transaction.adapter, transaction.name), []).append(transaction)
+
+        projection = {"_id": 0, **{field: 1 for field in TRANSACTION_FIELDS}}
 
-        return False
+        new_transactions: list[Transaction] = []
 
-    def store_transaction(self, transaction: Transaction) -> None:
-        """Store a transaction.
+        for (adapter, name), account_transactions in accounts.items():
+            dates = [transaction.date for transaction in account_transactions]
+
+            stored = collection.find(
+                {
+                    "adapter": adapter,
+                    "name": name,
+                    "date": {"$gte": min(dates), "$lte": max(dates)},
+                },
+                projection,
+            )
+            known = {tuple(document.get(field) for field in TRANSACTION_FIELDS) for document in stored}
+
+            for transaction in account_transactions:
+                key = tuple(getattr(transaction, field) for field in TRANSACTION_FIELDS)
+
+                if key in known:
+                    continue
+
+                known.add(key)
+                new_transactions.append(transaction)
+
+        if new_transactions:
+            inserted = datetime.datetime.now(datetime.timezone.utc)
+
+            collection.insert_many(  # pyright: ignore
+                [
+                    {
+                        "inserted": inserted,
+                        "amount_value": _amount_value(transaction.amount),
+                        **transaction.__dict__,
+                    }
+                    for transaction in new_transactions
+                ]
+            )
+
+        return new_transactions
+
+    def query_transactions(
+        self,
+        adapter: str | None = None,
+        name: str | None = None,
+        date_from: datetime.datetime | None = None,
+        date_to: datetime.datetime | None = None,
+        amount_min: Decimal | None = None,
+        amount_max: Decimal | None = None,
+        iban: str | None = None,
+        include_archive: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream stored transactions matching all given filters.
+
+        The results are read in batches from a server-side cursor, so memory
+        usage does not grow with the size of the result. Archived transactions
+        are streamed first, if requested.
 
         Args:
-            endpoint (str): endpoint description as described in the config.
-            account (str): account as described in the config.
-            transaction (Transactio): transaction info to store.
+            adapter (str | None): adapter used for access to an endpoint as described in the config.
+            name (str | None): account name in the config.
+            date_from (datetime | None): earliest booking date, inclusive.
+            date_to (datetime | None): latest booking date, inclusive.
+            amount_min (Decimal | None): lowest amount, inclusive.
+            amount_max (Decimal | None): highest amount, inclusive.
+            iban (str | None): IBAN of the applicant.
+            include_archive (bool): whether to include archived transactions.
+
+        Returns:
+            Iterator[dict[str, Any]]: transaction fields of each match. Archived transactions are ordered by
+            month only, the remaining transactions by date.
         """
+        if include_archive and self.archive is not None:
+            yield from self.archive.scan(adapter, name, date_from, date_to, amount_min, amount_max, iban)
+
         collection = self.client["footboi"]["transactions"]
-        collection.create_index("inserted", expireAfterSeconds=_EXPIRY_PERIOD)
 
-        collection.insert_one(  # pyright: ignore
-            {
-                "inserted": datetime.datetime.now(datetime.timezone.utc),
-                **transaction.__dict__,
-            }
-        )
+        query: dict[str, Any] = {}
+
+        if adapter is not None:
+            query["adapter"] = adapter
+        if name is not None:
+            query["name"] = name
+        if iban is not None:
+            query["applicant_iban"] = iban
+
+        date_range: dict[str, Any] = {}
+        if date_from is not None:
+            date_range["$gte"] = date_from
+        if date_to is not None:
+            date_range["$lte"] = date_to
+        if date_range:
+            query["date"] = date_range
+
+        amount_range: dict[str, Any] = {}
+        if amount_min is not None:
+            amount_range["$gte"] = Decimal128(amount_min)
+        if amount_max is not None:
+            amount_range["$lte"] = Decimal128(amount_max)
+        if amount_range:
+            query["amount_value"] = amount_range
+
+        projection = {"_id": 0, **{field: 1 for field in TRANSACTION_FIELDS}}
+
+        with collection.find(query, projection, batch_size=_QUERY_BATCH_SIZE).sort("date", ASCENDING) as cursor:
+            yield from cursor
+
+    @traced("storage.archive_expired")
+    def archive_expired(self) -> int:
+        """Move transactions past the retention period into the archive.
+
+        Returns:
+            int: number of archived transactions.
+        """
+        if self.archive is None:
+            return 0
+
+        collection = self.client["footboi"]["transactions"]
+
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - self.retention
+        projection = {field: 1 for field in TRANSACTION_FIELDS + ["inserted"]}
+
+        archived = 0
+
+        while True:
+            documents = list(
+                collection.find({"inserted": {"$lt": cutoff}}, projection)
+                .sort("inserted", ASCENDING)
+                .limit(_ARCHIVE_BATCH_SIZE)
+            )
+
+            if not documents:
+                break
+
+            # NOTE (empwilli 2026-10-19): Write before deleting, a crash in
+            # between leaves duplicates in the archive rather than losing
+            # transactions.
+            self.archive.write(documents)
+            collection.delete_many({"_id": {"$in": [document["_id"] for document in documents]}})
+
+            archived += len(documents)
+
+        if archived:
+            logger.info("Archived %s expired transactions.", archived)
+
+        return archived
+
+    @traced("storage.append_events")
+    def append_events(self, type: str, data: list[dict[str, Any]]) -> None:
+        """Append events to the event feed.
+
+        Every event gets a strictly increasing sequence number that consumers
+        use as resume token.
+
+        Args:
+            type (str): event type, e.g. "transactions.new".
+            data (list[dict[str, Any]]): payload of each event.
+        """
+        if not data:
+            return
+
+        counters = self.client["footboi"]["counters"]
+
+        # NOTE (empwilli 2026-10-19): Reserving the sequence numbers also locks
+        # the counter until the batch is inserted. Otherwise a consumer could
+        # skip over the batch of a concurrent writer, e.g. `fetch` run by cron
+        # next to `serve`, whose numbers are reserved but not yet inserted. The
+        # lock expires, so that a crashed writer does not block the feed.
+        while True:
+            now = datetime.datetime.now(datetime.timezone.utc)
+
+            try:
+                counter = counters.find_one_and_update(
+                    {"_id": "events", "locked_until": {"$not": {"$gt": now}}},
+                    {"$inc": {"seq": len(data)}, "$set": {"locked_until": now + _EVENTS_LOCK_LEASE}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError:
+                # The counter exists, but is locked by another writer.
+                time.sleep(_EVENTS_LOCK_RETRY_IN_SECONDS)
+                continue
+
+            break
+
+        assert counter is not None
+
+        first_seq = counter["seq"] - len(data) + 1
+
+        try:
+            self.client["footboi"]["events"].insert_many(  # pyright: ignore
+                [
+                    {
+                        "seq": first_seq + offset,
+                        "type": type,
+                        "timestamp": now,
+                        "data": event_data,
+                    }
+                    for offset, event_data in enumerate(data)
+                ]
+            )
+        finally:
+            counters.update_one({"_id": "events"}, {"$set": {"locked_until": None}})
+
+    def first_event_seq(self) -> int | None:
+        """Get the sequence number of the oldest retained event.
+
+        Returns:
+            int | None: sequence number the feed continues with, None if unknown because
+            no events are retained and a writer currently holds the counter.
+        """
+        event = self.client["footboi"]["events"].find_one({}, {"seq": 1}, sort=[("seq", ASCENDING)])
+
+        if event is not None:
+            return event["seq"]
+
+        counter = self.client["footboi"]["counters"].find_one({"_id": "events"})
+
+        if counter is None:
+            return 1
+
+        if counter.get("locked_until") is not None:
+            return None
+
+        return counter["seq"] + 1
+
+    def events_after(self, seq: int, limit: int) -> list[dict[str, Any]]:
+        """Get the events following a resume token.
+
+        Args:
+            seq (int): sequence number of the last event seen by the consumer, 0 to start
+                from the oldest retained event.
+            limit (int): maximum number of events to return.
+
+        Returns:
+            list[dict[str, Any]]: events ordered by sequence number.
+        """
+        collection = self.client["footboi"]["events"]
+
+        cursor = collection.find({"seq": {"$gt": seq}}, {"_id": 0}).sort("seq", ASCENDING).limit(limit)
+
+        return list(cursor)
 
+    @traced("storage.is_account_enabled")
     def is_account_enabled(self, adapter: str, name: str) -> bool:
         """Check whether the endpoint is currently enabled.
 
@@ -84,6 +412,7 @@ class Storage:
 
         return info.get("active", False)
 
+    @traced("storage.enable_account")
     def enable_account(self, adapter: str, name: str) -> None:
         """Disable an account.
 
@@ -108,6 +437,7 @@ class Storage:
             upsert=True,
         )
 
+    @traced("storage.disable_account")
     def disable_account(self, adapter: str, name: str) -> None:
         """Disable an account.
 
@@ -129,6 +459,7 @@ class Storage:
             },
         )
 
+    @traced("storage.update_account_data")
     def update_account_data(self, adapter: str, name: str, data: bytes) -> None:
         """Update auxiliary data for an account.
 
@@ -147,6 +478,7 @@ class Storage:
             }
         )
 
+    @traced("storage.account_data")
     def account_data(self, adapter: str, name: str) -> bytes | None:
         """Get auxiliary data for the respective endpoint.
 
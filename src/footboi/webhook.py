@@ -12,18 +12,19 @@ import requests
 
 from footboi.common import Transaction
 from footboi.config import Notification
+from footboi.profiling import span
 
 logger = logging.Logger(__name__)
 
 
-class _HookType(StrEnum):
+class HookType(StrEnum):
     FetchFail = "fetch.failure"
     NewTransactions = "transactions.new"
 
 
 @dataclass
 class _Payload:
-    type: _HookType
+    type: HookType
     timestamp: datetime
     data: dict[str, Any]
 
@@ -42,7 +43,7 @@ class _PayloadEncoder(json.JSONEncoder):
         return super().default(o)  # type: ignore
 
 
-def _notify(endpoints: list[str], type: _HookType, data: dict[str, Any]) -> None:
+def _notify(endpoints: list[str], type: HookType, data: dict[str, Any]) -> None:
     notification = _Payload(
         type=type,
         timestamp=datetime.now(),
@@ -50,7 +51,8 @@ def _notify(endpoints: list[str], type: _HookType, data: dict[str, Any]) -> None
     )
 
     for endpoint in endpoints:
-        request = requests.post(endpoint, data=json.dumps(notification, cls=_PayloadEncoder))
+        with span("webhook.post"):
+            request = requests.post(endpoint, data=json.dumps(notification, cls=_PayloadEncoder))
         if request.status_code >= 400:
             logger.warning(
                 "Could not reach endpoint %s: %s.",
@@ -63,7 +65,7 @@ def notify_transactions(config: Notification, transactions: list[Transaction]) -
     for transaction in transactions:
         _notify(
             list(map(str, config.endpoints or [])),
-            _HookType.NewTransactions,
+            HookType.NewTransactions,
             transaction.__dict__,
         )
 
@@ -71,7 +73,7 @@ def notify_transactions(config: Notification, transactions: list[Transaction]) -
 def notify_poll_fail(config: Notification, bank: str, account: str) -> None:
     _notify(
         list(map(str, config.endpoints or [])),
-        _HookType.FetchFail,
+        HookType.FetchFail,
         {
             "bank": bank,
             "account": account,
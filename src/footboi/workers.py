@@ -0,0 +1,236 @@
+"""Poll adapters in a pool of worker processes.
+
+Workers neither access the storage nor send notifications. For each poll, the
+coordinating process sends the stored state of the account, e.g. a FinTS
+dialog, and the worker returns the transactions along with the new state. The
+coordinator then stores the state, or disables the account if the poll failed.
+Every worker talks to the coordinator over its own pipe, so a worker that
+crashes or exceeds the poll timeout is replaced without affecting the polls
+running in other workers. Workers are also replaced after a configurable number
+of polls, so that leaks in the adapters do not accumulate.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import TYPE_CHECKING, Self
+
+from footboi.common import Adapter, Transaction
+from footboi.profiling import record_span
+
+if TYPE_CHECKING:
+    from footboi.config import Config
+    from footboi.storage import Storage
+
+# NOTE (empwilli 2026-10-19): Spawn rather than fork, the coordinator runs
+# threads and holds a MongoClient, neither of which survive a fork.
+_CONTEXT = multiprocessing.get_context("spawn")
+
+_STOP_TIMEOUT_IN_SECONDS = 5
+
+
+class WorkerError(Exception):
+    """The worker polling an account crashed or exceeded the poll timeout."""
+
+
+@dataclass
+class _PollRequest:
+    adapter: type[Adapter]
+    name: str
+    state: bytes | None
+
+
+@dataclass
+class _PollResult:
+    transactions: list[Transaction]
+    state: bytes | None
+
+
+@dataclass
+class _PollFailure:
+    message: str
+
+
+def _worker_main(config: Config, connection: Connection) -> None:
+    while True:
+        request = connection.recv()
+
+        if request is None:
+            return
+
+        assert isinstance(request, _PollRequest)
+
+        # NOTE (empwilli 2026-10-19): Send errors as text, exceptions raised by
+        # the adapters' dependencies are not necessarily picklable.
+        try:
+            transactions, state = request.adapter.poll_account(config, request.name, request.state)
+            connection.send(_PollResult(transactions, state))
+        except Exception as e:
+            connection.send(_PollFailure(str(e)))
+
+
+class _Worker:
+    def __init__(self, config: Config) -> None:
+        self.connection, child_connection = _CONTEXT.Pipe()
+        self.process = _CONTEXT.Process(target=_worker_main, args=(config, child_connection), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.polls = 0
+
+    def send(self, request: _PollRequest) -> None:
+        self.connection.send(request)
+
+    def receive(self) -> _PollResult | _PollFailure:
+        response = self.connection.recv()
+
+        assert isinstance(response, (_PollResult, _PollFailure))
+
+        return response
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+
+        self.process.join(_STOP_TIMEOUT_IN_SECONDS)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.connection.close()
+
+
+@dataclass
+class _Running:
+    worker: _Worker
+    account: Adapter
+    start: float
+    deadline: float
+
+
+class WorkerPool:
+    """Pool of worker processes for polling."""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.idle: list[_Worker] = []
+
+    def _release(self, worker: _Worker) -> None:
+        worker.polls += 1
+
+        max_polls = self.config.workers.max_polls_per_worker
+
+        if max_polls is not None and worker.polls >= max_polls:
+            worker.stop()
+        else:
+            self.idle.append(worker)
+
+    def _start(self, account: Adapter, state: bytes | None) -> _Worker:
+        request = _PollRequest(type(account), account.get_name(), state)
+        worker = self.idle.pop() if self.idle else _Worker(self.config)
+
+        try:
+            worker.send(request)
+        except OSError:
+            # NOTE (empwilli 2026-10-19): The worker died while idle.
+            worker.kill()
+            worker = _Worker(self.config)
+            worker.send(request)
+
+        return worker
+
+    def poll(
+        self, accounts: list[Adapter], storage: Storage
+    ) -> Iterator[tuple[Adapter, list[Transaction] | Exception]]:
+        """Poll accounts in the worker processes.
+
+        Stores the new state of each account polled successfully.
+
+        Args:
+            accounts (list[Adapter]): accounts to poll.
+            storage (Storage): storage holding the state of the accounts.
+
+        Returns:
+            Iterator[tuple[Adapter, list[Transaction] | Exception]]: each account with its polled
+            transactions or the reason the poll failed, in order of completion. A `WorkerError` indicates
+            that the worker crashed or exceeded the poll timeout.
+        """
+        poll_timeout = self.config.workers.poll_timeout
+        timeout = poll_timeout.total_seconds() if poll_timeout else math.inf
+
+        pending = deque(accounts)
+        running: dict[Connection, _Running] = {}
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.config.workers.processes:
+                    account = pending.popleft()
+                    state = storage.account_data(account.get_adapter(), account.get_name())
+
+                    start = time.perf_counter()
+                    worker = self._start(account, state)
+                    running[worker.connection] = _Running(worker, account, start, start + timeout)
+
+                next_deadline = min(entry.deadline for entry in running.values())
+                wait_time = None if next_deadline == math.inf else max(0.0, next_deadline - time.perf_counter())
+
+                ready = wait(list(running), wait_time)
+
+                for connection, entry in list(running.items()):
+                    account = entry.account
+                    span_name = f"poll.{account.get_adapter()}.{account.get_name()}"
+
+                    if connection in ready:
+                        del running[connection]
+
+                        try:
+                            response = entry.worker.receive()
+                        except (EOFError, OSError):
+                            record_span(span_name, entry.start)
+                            entry.worker.kill()
+                            yield account, WorkerError(f"worker exited with code {entry.worker.process.exitcode}")
+                            continue
+
+                        record_span(span_name, entry.start)
+                        self._release(entry.worker)
+
+                        if isinstance(response, _PollFailure):
+                            yield account, ValueError(response.message)
+                            continue
+
+                        if response.state is not None:
+                            storage.update_account_data(account.get_adapter(), account.get_name(), response.state)
+
+                        yield account, response.transactions
+                    elif entry.deadline <= time.perf_counter():
+                        del running[connection]
+                        record_span(span_name, entry.start)
+                        entry.worker.kill()
+                        yield account, WorkerError(f"poll exceeded timeout of {timeout}s")
+        finally:
+            # NOTE (empwilli 2026-10-19): Don't leave polls running if the
+            # caller stops early.
+            for entry in running.values():
+                entry.worker.kill()
+
+    def shutdown(self) -> None:
+        for worker in self.idle:
+            worker.stop()
+
+        self.idle = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
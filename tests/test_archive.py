@@ -0,0 +1,101 @@
+"""Tests for the transaction archive."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from footboi.archive import Archive
+
+
+def _document(date: datetime, amount: str = "10.00 EUR", name: str = "bank1") -> dict[str, Any]:
+    return {
+        "_id": object(),
+        "adapter": "fints",
+        "name": name,
+        "date": date,
+        "amount": amount,
+        "applicant_bin": "BIN",
+        "applicant_iban": "DE00123",
+        "applicant_name": "applicant",
+        "purpose": "purpose",
+        "recipient_name": "recipient",
+        "inserted": datetime(2024, 12, 1),
+    }
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Archive:
+    return Archive(tmp_path / "archive")
+
+
+def test_write_partitions_by_month(archive: Archive) -> None:
+    archive.write([_document(datetime(2024, 10, 5)), _document(datetime(2024, 11, 2))])
+    archive.write([_document(datetime(2024, 10, 20))])
+
+    index = json.loads((archive.path / "index.json").read_text())
+
+    assert index == {
+        "2024-10.jsonl.gz": {"first": "2024-10-05T00:00:00", "last": "2024-10-20T00:00:00", "count": 2},
+        "2024-11.jsonl.gz": {"first": "2024-11-02T00:00:00", "last": "2024-11-02T00:00:00", "count": 1},
+    }
+
+
+def test_scan_reads_appended_members(archive: Archive) -> None:
+    archive.write([_document(datetime(2024, 10, 5))])
+    archive.write([_document(datetime(2024, 10, 20))])
+
+    dates = [transaction["date"] for transaction in archive.scan()]
+
+    assert dates == [datetime(2024, 10, 5), datetime(2024, 10, 20)]
+
+
+def test_scan_returns_transaction_fields(archive: Archive) -> None:
+    archive.write([_document(datetime(2024, 10, 5))])
+
+    (transaction,) = archive.scan()
+
+    assert "_id" not in transaction
+    assert "inserted" not in transaction
+    assert transaction["amount"] == "10.00 EUR"
+
+
+def test_scan_skips_partitions_outside_date_range(archive: Archive) -> None:
+    archive.write([_document(datetime(2024, 10, 5)), _document(datetime(2024, 11, 2))])
+    (archive.path / "2024-10.jsonl.gz").write_bytes(b"not gzip")
+
+    dates = [transaction["date"] for transaction in archive.scan(date_from=datetime(2024, 11, 1))]
+
+    assert dates == [datetime(2024, 11, 2)]
+
+
+def test_scan_filters(archive: Archive) -> None:
+    archive.write(
+        [
+            _document(datetime(2024, 10, 5), "-5.00 EUR"),
+            _document(datetime(2024, 10, 6), "20.00 EUR"),
+            _document(datetime(2024, 10, 7), "20.00 EUR", name="bank2"),
+        ]
+    )
+
+    transactions = list(
+        archive.scan(name="bank1", date_to=datetime(2024, 10, 31), amount_min=Decimal(0), amount_max=Decimal(100))
+    )
+
+    assert [transaction["date"] for transaction in transactions] == [datetime(2024, 10, 6)]
+
+
+def test_scan_skips_indexed_partition_without_file(archive: Archive) -> None:
+    archive.write([_document(datetime(2024, 11, 2))])
+    (archive.path / "2024-11.jsonl.gz").unlink()
+
+    assert list(archive.scan()) == []
+
+
+def test_scan_empty_archive(archive: Archive) -> None:
+    assert list(archive.scan()) == []
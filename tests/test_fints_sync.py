@@ -0,0 +1,47 @@
+"""Tests for the FINTS adapter."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from mt940.models import Amount, Date
+from mt940.models import Transaction as Mt940Transaction
+
+from footboi.adapters.fints_sync import to_transactions
+
+
+def _mt940(**data: object) -> Mt940Transaction:
+    return Mt940Transaction(None, {"date": Date(2024, 10, 5), "amount": Amount("12.34", "D", "EUR"), **data})
+
+
+def test_to_transactions() -> None:
+    mt940 = _mt940(
+        applicant_bin="BIN",
+        applicant_iban="DE00123",
+        applicant_name="applicant",
+        purpose="purpose",
+        recipient_name="recipient",
+    )
+
+    (transaction,) = to_transactions("bank1", [mt940])
+
+    assert transaction.adapter == "fints"
+    assert transaction.name == "bank1"
+    assert transaction.date == datetime(2024, 10, 5)
+    assert transaction.amount == "-12.34 EUR"
+    assert transaction.applicant_iban == "DE00123"
+    assert transaction.recipient_name == "recipient"
+
+
+def test_to_transactions_without_applicant_iban() -> None:
+    (transaction,) = to_transactions("bank1", [_mt940(applicant_name="applicant")])
+
+    assert transaction.applicant_iban is None
+    assert transaction.applicant_bin is None
+    assert transaction.applicant_name == "applicant"
+
+
+def test_to_transactions_statement() -> None:
+    transactions = to_transactions("bank1", [_mt940(), _mt940(date=Date(2024, 10, 6))])
+
+    assert [transaction.date for transaction in transactions] == [datetime(2024, 10, 5), datetime(2024, 10, 6)]
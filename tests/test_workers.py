@@ -0,0 +1,132 @@
+"""Tests for polling in worker processes."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, cast
+
+from footboi.common import Adapter, Transaction
+from footboi.config import Config
+from footboi.storage import Storage
+from footboi.workers import WorkerError, WorkerPool
+
+
+class StubAdapter:
+    """Adapter whose behaviour in the worker depends on the account name."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @staticmethod
+    def poll_account(config: Config, name: str, state: bytes | None) -> tuple[list[Transaction], bytes | None]:
+        if name == "crash":
+            os._exit(1)
+        if name == "hang":
+            time.sleep(60)
+        if name == "fail":
+            raise ValueError("login failed")
+
+        return [], str(os.getpid()).encode()
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_adapter(self) -> str:
+        return "stub"
+
+
+class StubStorage:
+    def __init__(self) -> None:
+        self.data: dict[tuple[str, str], bytes] = {}
+
+    def account_data(self, adapter: str, name: str) -> bytes | None:
+        return self.data.get((adapter, name))
+
+    def update_account_data(self, adapter: str, name: str, data: bytes) -> None:
+        self.data[(adapter, name)] = data
+
+
+def _config(**workers: Any) -> Config:
+    return Config.model_validate(
+        {
+            "interval": "30m",
+            "storage": {"mongo": "mongodb://localhost"},
+            "notification": {},
+            "workers": {"processes": 2, "poll_timeout": "30s", **workers},
+        }
+    )
+
+
+def _poll(pool: WorkerPool, storage: StubStorage, *names: str) -> dict[str, list[Transaction] | Exception]:
+    accounts = [cast(Adapter, StubAdapter(name)) for name in names]
+
+    return {account.get_name(): result for account, result in pool.poll(accounts, cast(Storage, storage))}
+
+
+def test_poll_stores_state() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config()) as pool:
+        results = _poll(pool, storage, "ok")
+
+    assert results == {"ok": []}
+    assert storage.account_data("stub", "ok") is not None
+
+
+def test_poll_failure_keeps_state() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config()) as pool:
+        results = _poll(pool, storage, "fail")
+
+    assert isinstance(results["fail"], ValueError)
+    assert str(results["fail"]) == "login failed"
+    assert storage.account_data("stub", "fail") is None
+
+
+def test_poll_contains_crash() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config()) as pool:
+        results = _poll(pool, storage, "crash", "ok")
+
+    assert isinstance(results["crash"], WorkerError)
+    assert results["ok"] == []
+
+
+def test_poll_timeout() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config(poll_timeout="5s")) as pool:
+        start = time.monotonic()
+        results = _poll(pool, storage, "hang", "ok")
+
+    assert time.monotonic() - start < 20
+    assert isinstance(results["hang"], WorkerError)
+    assert results["ok"] == []
+
+
+def test_poll_recycles_workers() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config(processes=1, max_polls_per_worker=1)) as pool:
+        _poll(pool, storage, "ok")
+        first_pid = storage.account_data("stub", "ok")
+        _poll(pool, storage, "ok")
+
+    assert storage.account_data("stub", "ok") != first_pid
+
+
+def test_poll_replaces_dead_idle_worker() -> None:
+    storage = StubStorage()
+
+    with WorkerPool(_config(processes=1)) as pool:
+        _poll(pool, storage, "ok")
+        (worker,) = pool.idle
+        worker.process.kill()
+        worker.process.join()
+
+        results = _poll(pool, storage, "ok")
+
+    assert results == {"ok": []}